@@ -1,11 +1,15 @@
 # chuk_leaderboard/rating_systems/elo.py
 import math
 from typing import List, Tuple
+import numpy as np
 
 # imports
 from chuk_leaderboard.rating_systems.rating_system import RatingSystem
 from chuk_leaderboard.rating_systems.registry import RatingSystemRegistry
 
+# 10**(x/400) == exp(x * ln(10)/400); exp is cheaper than a float pow
+_LN10_OVER_400 = math.log(10.0) / 400.0
+
 class EloRatingSystem(RatingSystem):
     """
     Elo rating system implementation.
@@ -60,6 +64,36 @@ class EloRatingSystem(RatingSystem):
         
         return new_rating
     
+    def calculate_rating_batch(self, current_rating: float,
+                               opponent_ratings: np.ndarray, results: np.ndarray) -> float:
+        """
+        Calculate new rating for a whole rating period held in arrays.
+        
+        Equivalent to calculate_rating, but evaluates every match in one
+        vectorized pass, which is much faster when replaying long seasons.
+        
+        Args:
+            current_rating: Current rating
+            opponent_ratings: Array of opponent ratings
+            results: Array of results (1 for win, 0.5 for draw, 0 for loss)
+        
+        Returns:
+            New rating
+            
+        Raises:
+            ValueError: If opponent_ratings and results have different shapes
+        """
+        opponent_ratings = np.asarray(opponent_ratings, dtype=np.float64)
+        results = np.asarray(results, dtype=np.float64)
+        if opponent_ratings.shape != results.shape:
+            raise ValueError(f"opponent_ratings and results must have the same shape, "
+                             f"got {opponent_ratings.shape} and {results.shape}")
+        if opponent_ratings.size == 0:
+            return current_rating
+        
+        expected = 1.0 / (1.0 + np.exp((opponent_ratings - current_rating) * _LN10_OVER_400))
+        return float(current_rating + self.k_factor * np.sum(results - expected))
+    
     def calculate_rating_change(self, rating: float, opponent_rating: float, result: float) -> float:
         """
         Calculate the rating change for a single match.
@@ -86,7 +120,7 @@ class EloRatingSystem(RatingSystem):
         Returns:
             Probability (0-1) of player 1 winning against player 2
         """
-        return 1.0 / (1.0 + math.pow(10, (rating2 - rating1) / 400.0))
+        return 1.0 / (1.0 + math.exp((rating2 - rating1) * _LN10_OVER_400))
     
     def get_default_rating(self) -> float:
         """
@@ -1,13 +1,426 @@
 # chuk_leaderboard/rating_systems/points_based.py
+import functools
 import math
-import statistics
-from typing import List, Tuple, Dict, Optional, Any, Union
+from typing import List, Tuple, Dict, Optional, Any, Union, NamedTuple, Iterable
 import numpy as np
 
 # imports
 from chuk_leaderboard.rating_systems.rating_system import RatingSystem
 from chuk_leaderboard.rating_systems.registry import RatingSystemRegistry
 
+# Trend labels indexed by the sign of the change (+1 so "down" is at index 0)
+_TREND_LABELS = ("down", "stable", "up")
+
+# Below this many outcomes, converting to a NumPy array costs more than it saves
+_SMALL_BATCH = 64
+
+
+class HistoryBuffer:
+    """
+    Growable float64 history of per-event points.
+    
+    Values live unboxed in one contiguous array whose capacity doubles when full,
+    so appending is amortized O(1) and reductions read contiguous memory. Opt in
+    by starting a participant with (total_points, HistoryBuffer()); default
+    ratings use a plain list.
+    
+    Iteration and indexing read the array directly and yield np.float64 values
+    (a float subclass); slicing returns a list so truthiness checks behave as
+    they do for the list history. It also supports len, equality with lists,
+    `+` with a list (returning a list), append/extend and the NumPy array
+    protocol. It is not JSON-serializable; convert it with view().tolist() first.
+    """
+    __slots__ = ('data', 'used')
+    
+    def __init__(self, values: Optional[List[float]] = None):
+        """
+        Initialize the buffer.
+        
+        Args:
+            values: Optional initial values
+        """
+        self.data = np.empty(8, dtype=np.float64)
+        self.used = 0
+        if values is not None:
+            self.extend(values)
+    
+    def _reserve(self, needed: int) -> None:
+        """Grow the backing array (at least doubling it) to hold `needed` values."""
+        capacity = self.data.size
+        if needed <= capacity:
+            return
+        data = np.empty(max(needed, capacity * 2), dtype=np.float64)
+        data[:self.used] = self.data[:self.used]
+        self.data = data
+    
+    def append(self, value: float) -> None:
+        """
+        Append a single value.
+        
+        Args:
+            value: Points for one event
+        """
+        self._reserve(self.used + 1)
+        self.data[self.used] = value
+        self.used += 1
+    
+    def extend(self, values: Iterable[float]) -> None:
+        """
+        Append several values in one copy.
+        
+        Args:
+            values: Points for each event (any iterable, including generators)
+        """
+        if hasattr(values, '__len__'):
+            values = np.asarray(values, dtype=np.float64).ravel()
+        else:
+            values = np.fromiter(values, dtype=np.float64)
+        end = self.used + values.size
+        self._reserve(end)
+        self.data[self.used:end] = values
+        self.used = end
+    
+    def copy(self) -> "HistoryBuffer":
+        """
+        Copy the buffer.
+        
+        Returns:
+            New HistoryBuffer holding the same values
+        """
+        return HistoryBuffer(self.view())
+    
+    def view(self) -> np.ndarray:
+        """
+        Get the stored values without copying.
+        
+        Returns:
+            Array view of the used part of the buffer
+        """
+        return self.data[:self.used]
+    
+    def __len__(self) -> int:
+        return self.used
+    
+    def __iter__(self):
+        return iter(self.view())
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.view()[index].tolist()
+        return self.view()[index]
+    
+    def __array__(self, dtype=None, copy=None):
+        return np.array(self.view(), dtype=dtype, copy=copy)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, HistoryBuffer):
+            other = other.view()
+        try:
+            other = np.asarray(other, dtype=np.float64)
+        except (TypeError, ValueError):
+            return NotImplemented
+        return other.shape == (self.used,) and bool(np.array_equal(self.view(), other))
+    
+    __hash__ = None
+    
+    def __add__(self, other) -> List[float]:
+        return self.view().tolist() + list(other)
+    
+    def __radd__(self, other) -> List[float]:
+        return list(other) + self.view().tolist()
+    
+    def __repr__(self) -> str:
+        return f"HistoryBuffer({self.view().tolist()})"
+
+
+class PointsRating(NamedTuple):
+    """
+    Points-based rating: accumulated total plus the per-event history.
+    
+    Being a tuple, it still unpacks and indexes as (total_points, points_history),
+    while named tuples carry no per-instance __dict__.
+    """
+    total: float
+    history: Union[List[float], HistoryBuffer]
+
+
+class Projection(NamedTuple):
+    """
+    End-of-season projection for one participant.
+    
+    Besides attribute access, the dictionary reads used on the dictionary previously
+    returned by project_season_finish still work: projection["projected_points"],
+    "projected_points" in projection, get(), keys(), values() and items(). Being a
+    tuple, however, iteration and len() follow the field values, and json.dumps
+    emits a list; use to_dict() where a real dictionary is needed.
+    """
+    projected_points: float
+    min_points: float
+    max_points: float
+    lower_bound: float
+    upper_bound: float
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+    
+    def __contains__(self, key) -> bool:
+        if isinstance(key, str):
+            return key in self._fields
+        return tuple.__contains__(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a field by name, as dict.get.
+        
+        Args:
+            key: Field name
+            default: Value returned if the field does not exist
+            
+        Returns:
+            Field value, or default
+        """
+        return getattr(self, key) if key in self._fields else default
+    
+    def keys(self) -> Tuple[str, ...]:
+        """
+        Get the field names, as dict.keys.
+        
+        Returns:
+            Tuple of field names
+        """
+        return self._fields
+    
+    def values(self) -> Tuple[float, ...]:
+        """
+        Get the field values, as dict.values.
+        
+        Returns:
+            Tuple of field values
+        """
+        return tuple(self)
+    
+    def items(self) -> List[Tuple[str, float]]:
+        """
+        Get (field name, value) pairs, as dict.items.
+        
+        Returns:
+            List of (field name, value) pairs
+        """
+        return list(zip(self._fields, self))
+    
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Convert the projection to a dictionary.
+        
+        Returns:
+            Dictionary mapping field names to values
+        """
+        return self._asdict()
+
+
+def _z_score(confidence_level: float) -> float:
+    """
+    Get the two-sided z-score for a projection confidence level.
+    
+    Args:
+        confidence_level: Confidence level (0.90 or 0.95; anything else uses 99%)
+        
+    Returns:
+        z-score
+    """
+    # For 95% confidence, use ~2 standard deviations
+    return 1.96 if confidence_level == 0.95 else 1.645 if confidence_level == 0.90 else 2.576
+
+
+def _score_plain(outcomes: List[float]) -> float:
+    """
+    Score a small batch of raw point values with no rank or bonus rules.
+    
+    Args:
+        outcomes: Raw point values
+        
+    Returns:
+        Total points for the batch
+    """
+    return float(sum(outcomes))
+
+
+def _score_bonus(outcomes: List[float], bonus_threshold: float, bonus_points: float) -> float:
+    """
+    Score a small batch of raw point values, adding bonus points above the threshold.
+    
+    Args:
+        outcomes: Raw point values
+        bonus_threshold: Score above which bonus points are awarded
+        bonus_points: Extra points awarded above the threshold
+        
+    Returns:
+        Total points for the batch
+    """
+    # A conditional expression beats branch-free "bonus_points * (score > bonus_threshold)"
+    # in CPython, where the bool-to-float multiply costs more than the branch
+    total = 0.0
+    for score in outcomes:
+        total += score + bonus_points if score > bonus_threshold else score
+    return total
+
+
+def _score_rank(outcomes: List[float], rank_points: List[float]) -> float:
+    """
+    Score a small batch of finishing ranks with the rank points table.
+    
+    Args:
+        outcomes: Finishing ranks (1 = first place)
+        rank_points: Points awarded for each rank; other ranks score 0
+        
+    Returns:
+        Total points for the batch
+    """
+    n_ranks = len(rank_points)
+    total = 0.0
+    for score in outcomes:
+        rank = int(score) - 1  # Convert to 0-based index
+        if 0 <= rank < n_ranks:
+            total += rank_points[rank]
+    return total
+
+
+def _score_rank_bonus(outcomes: List[float], rank_points: List[float],
+                      bonus_threshold: float, bonus_points: float) -> float:
+    """
+    Score a small batch of finishing ranks, adding bonus points above the threshold.
+    
+    Args:
+        outcomes: Finishing ranks (1 = first place)
+        rank_points: Points awarded for each rank; other ranks score 0
+        bonus_threshold: Score above which bonus points are awarded
+        bonus_points: Extra points awarded above the threshold
+        
+    Returns:
+        Total points for the batch
+    """
+    n_ranks = len(rank_points)
+    total = 0.0
+    for score in outcomes:
+        rank = int(score) - 1  # Convert to 0-based index
+        score = rank_points[rank] if 0 <= rank < n_ranks else 0.0
+        total += score + bonus_points if score > bonus_threshold else score
+    return total
+
+
+def _score_outcomes(arr: np.ndarray, rank_lut: Optional[np.ndarray],
+                    bonus_threshold: Optional[float], bonus_points: float) -> float:
+    """
+    Score a batch of outcomes in vectorized NumPy passes.
+    
+    Args:
+        arr: Raw outcome values as a float64 array
+        rank_lut: Rank points lookup table indexed by rank, zero-padded at both ends, or None.
+                  To award a bonus on ranked outcomes, fold it into the table and pass
+                  bonus_threshold=None
+        bonus_threshold: Score above which bonus points are awarded, or None
+        bonus_points: Extra points awarded above the threshold
+        
+    Returns:
+        Total points for the batch
+    """
+    if rank_lut is not None:
+        # Clipping sends ranks outside the specified list to one of the (zero-point) end slots
+        arr = np.take(rank_lut, arr.astype(np.intp), mode='clip')
+    
+    # Bonus is applied branch-free: one vectorized comparison mask, counted
+    total = arr.sum()
+    if bonus_threshold is not None:
+        total += bonus_points * np.count_nonzero(arr > bonus_threshold)
+    return float(total)
+
+
+class PlayerTable:
+    """
+    Column-oriented table of participants used for ranking.
+    
+    Names and totals are kept in parallel columns; ranking converts the totals
+    column to one contiguous array instead of sorting a dict of tuples.
+    """
+    
+    def __init__(self):
+        self.names: List[str] = []
+        self.totals: List[float] = []
+    
+    @classmethod
+    def from_ratings(cls, ratings: Dict[str, Tuple[float, List[float]]]) -> "PlayerTable":
+        """
+        Build a table from a dictionary of ratings in one pass.
+        
+        Args:
+            ratings: Dictionary mapping participant IDs to their (total_points, history)
+            
+        Returns:
+            Populated PlayerTable
+        """
+        table = cls()
+        table.names = list(ratings)
+        table.totals = [rating[0] for rating in ratings.values()]
+        return table
+    
+    def add(self, name: str, rating: Tuple[float, List[float]]) -> None:
+        """
+        Add a participant to the table.
+        
+        Args:
+            name: Participant ID
+            rating: (total_points, history); only the total is stored
+        """
+        self.names.append(name)
+        self.totals.append(rating[0])
+    
+    def rank(self) -> List[Tuple[str, float]]:
+        """
+        Rank participants by total points.
+        
+        Returns:
+            List of (participant_id, total_points) sorted by points (highest first),
+            with ties kept in insertion order
+        """
+        totals = np.asarray(self.totals, dtype=np.float64)
+        order = np.argsort(-totals, kind='stable')
+        return [(self.names[i], float(totals[i])) for i in order]
+    
+    def top_k(self, k: int) -> List[Tuple[str, float]]:
+        """
+        Rank only the k highest-scoring participants.
+        
+        Selects the k-th largest total with a linear-time partition and sorts just
+        the selected participants, giving the same result as rank()[:k].
+        
+        Args:
+            k: Number of participants to return
+            
+        Returns:
+            List of up to k (participant_id, total_points) sorted by points (highest first),
+            with ties kept in insertion order
+        """
+        totals = np.asarray(self.totals, dtype=np.float64)
+        n = totals.size
+        if k >= n:
+            return self.rank()
+        if k <= 0:
+            return []
+        
+        # Everyone above the k-th largest total, then the earliest-inserted ties to fill k
+        kth_total = np.partition(totals, n - k)[n - k]
+        above = np.flatnonzero(totals > kth_total)
+        tied = np.flatnonzero(totals == kth_total)[:k - above.size]
+        selected = np.concatenate((above, tied))
+        
+        order = selected[np.argsort(-totals[selected], kind='stable')]
+        return [(self.names[i], float(totals[i])) for i in order]
+
+
 class PointsBasedRankingSystem(RatingSystem):
     """
     Points-based ranking system implementation.
@@ -40,23 +453,75 @@ class PointsBasedRankingSystem(RatingSystem):
         """
         self._default_points = default_points
         self.points_history_weight = max(0.0, min(1.0, points_history_weight))
-        self.rank_points = rank_points
         self.weekly_average_window = max(1, weekly_average_window)
-        self.bonus_threshold = bonus_threshold
-        self.bonus_points = bonus_points
+        
+        # Scoring rules are fixed at construction (exposed as read-only properties) because
+        # the scoring kernels, lookup table and display name below are all derived from them
+        rank_points = tuple(rank_points) if rank_points is not None else None
+        self._rank_points = rank_points
+        self._bonus_threshold = bonus_threshold
+        self._bonus_points = bonus_points
+        
+        self._display_name = "Points-Based (Ranked)" if rank_points is not None else "Points-Based"
+        
+        # Small batches are scored by a loop specialised for this configuration,
+        # so the per-outcome work never re-checks which rules are enabled
+        if rank_points is not None and bonus_threshold is not None:
+            self._score_small = functools.partial(_score_rank_bonus, rank_points=rank_points,
+                                                  bonus_threshold=bonus_threshold, bonus_points=bonus_points)
+        elif rank_points is not None:
+            self._score_small = functools.partial(_score_rank, rank_points=rank_points)
+        elif bonus_threshold is not None:
+            self._score_small = functools.partial(_score_bonus, bonus_threshold=bonus_threshold,
+                                                  bonus_points=bonus_points)
+        else:
+            self._score_small = _score_plain
+        
+        # Rank -> points lookup table indexed directly by rank (slot 0 is rank 0);
+        # the zero slots at both ends score ranks outside the list as 0
+        if rank_points is not None:
+            rank_lut = np.concatenate(([0.0], np.asarray(rank_points, dtype=np.float64), [0.0]))
+            if bonus_threshold is not None:
+                # The bonus depends only on the mapped points, so fold it into the table
+                # and score large batches with a single gather-and-sum pass
+                rank_lut = rank_lut + bonus_points * (rank_lut > bonus_threshold)
+            self._rank_lut = rank_lut
+        else:
+            self._rank_lut = None
+    
+    @property
+    def rank_points(self) -> Optional[List[float]]:
+        """Points awarded for each rank [1st, 2nd, 3rd, ...], or None (read-only)."""
+        return list(self._rank_points) if self._rank_points is not None else None
+    
+    @property
+    def bonus_threshold(self) -> Optional[float]:
+        """Score above which bonus points are awarded, or None (read-only)."""
+        return self._bonus_threshold
+    
+    @property
+    def bonus_points(self) -> float:
+        """Extra points awarded above the bonus threshold (read-only)."""
+        return self._bonus_points
     
     def calculate_rating(self, current_rating: Union[float, Tuple[float, List[float]]], 
-                        outcomes: List[float]) -> Tuple[float, List[float]]:
+                        outcomes: List[float]) -> PointsRating:
         """
         Calculate new point total and update performance history.
         
+        With no outcomes, a PointsRating is returned as-is (no copy of the history).
+        
         Args:
             current_rating: Current (total_points, points_history) or just total_points
             outcomes: List of point values earned in recent events
         
         Returns:
-            Tuple of (new_total_points, updated_points_history)
+            PointsRating of (new_total_points, updated_points_history)
         """
+        # Nothing to apply: hand back the same rating object without any allocation
+        if not outcomes and isinstance(current_rating, PointsRating):
+            return current_rating
+        
         # Handle different input formats
         if isinstance(current_rating, tuple) and len(current_rating) == 2:
             total_points, points_history = current_rating
@@ -65,42 +530,81 @@ class PointsBasedRankingSystem(RatingSystem):
             points_history = []
         
         if not outcomes:
-            return (total_points, points_history)
-        
-        # Keep a copy of the original outcomes for history
-        original_outcomes = outcomes.copy()
-        
-        # Process outcomes for scoring while preserving the original values for history
-        processed_outcomes = outcomes.copy()
-        
-        # Apply rank points if specified
-        if self.rank_points is not None:
-            transformed = []
-            for score in processed_outcomes:
-                # Convert the score to a rank (assuming higher numbers indicate better rank)
-                # and then use the corresponding rank points.
-                rank = int(score) - 1  # Convert to 0-based index
-                if 0 <= rank < len(self.rank_points):
-                    transformed.append(self.rank_points[rank])
-                else:
-                    transformed.append(0.0)  # Default for ranks beyond the specified list
-            processed_outcomes = transformed
-        
-        # Apply bonus points if threshold is specified
-        if self.bonus_threshold is not None:
-            processed_outcomes = [
-                score + self.bonus_points if score > self.bonus_threshold else score
-                for score in processed_outcomes
-            ]
-        
-        # Calculate new total points using the processed outcomes
-        additional_points = sum(processed_outcomes)
-        new_total_points = total_points + additional_points
-        
-        # Update points history with the original outcomes
-        updated_history = points_history + original_outcomes
-        
-        return (new_total_points, updated_history)
+            return PointsRating(total_points, points_history)
+        
+        new_total_points = total_points + self._score(outcomes)
+        
+        # Update points history with the original outcomes, keeping the history's type
+        if isinstance(points_history, HistoryBuffer):
+            updated_history = points_history.copy()
+        else:
+            updated_history = list(points_history)
+        updated_history.extend(outcomes)
+        
+        return PointsRating(new_total_points, updated_history)
+    
+    def calculate_rating_inplace(self, current_rating: Tuple[float, List[float]],
+                                 outcomes: List[float]) -> PointsRating:
+        """
+        Calculate new point total, appending the outcomes to the existing history list.
+        
+        Unlike calculate_rating, the history is not copied, so replaying a whole
+        season costs time proportional to the number of events rather than its square.
+        Works with both plain lists and HistoryBuffer histories.
+        
+        Args:
+            current_rating: Current (total_points, points_history); points_history is modified
+            outcomes: List of point values earned in recent events
+        
+        Returns:
+            PointsRating of (new_total_points, points_history)
+        """
+        total_points, points_history = current_rating
+        
+        if not outcomes:
+            return PointsRating(total_points, points_history)
+        
+        new_total_points = total_points + self._score(outcomes)
+        points_history.extend(outcomes)
+        
+        return PointsRating(new_total_points, points_history)
+    
+    def batch_calculate(self, ratings: List[Union[float, Tuple[float, List[float]]]],
+                        outcomes_list: List[List[float]]) -> List[PointsRating]:
+        """
+        Update many independent participants, e.g. a whole league for one week.
+        
+        Args:
+            ratings: Current rating of each participant
+            outcomes_list: Outcomes for each participant, aligned with ratings
+            
+        Returns:
+            List of PointsRating, aligned with ratings
+            
+        Raises:
+            ValueError: If ratings and outcomes_list have different lengths
+        """
+        return [self.calculate_rating(rating, outcomes)
+                for rating, outcomes in zip(ratings, outcomes_list, strict=True)]
+    
+    def _score(self, outcomes: List[float]) -> float:
+        """
+        Score outcomes with rank points and bonus points applied as configured.
+        
+        Args:
+            outcomes: List of point values (or finishing ranks) earned in recent events
+            
+        Returns:
+            Total points for the outcomes
+        """
+        if len(outcomes) < _SMALL_BATCH:
+            return self._score_small(outcomes)
+        
+        arr = np.asarray(outcomes, dtype=np.float64)
+        if self._rank_lut is not None:
+            # Bonus already folded into the lookup table
+            return _score_outcomes(arr, self._rank_lut, None, 0.0)
+        return _score_outcomes(arr, None, self._bonus_threshold, self._bonus_points)
 
     def expected_outcome(self, rating1: Union[float, Tuple[float, List[float]]], 
                         rating2: Union[float, Tuple[float, List[float]]]) -> float:
@@ -114,47 +618,66 @@ class PointsBasedRankingSystem(RatingSystem):
         Returns:
             Probability (0-1) of participant1 outscoring participant2
         """
-        # Extract total points and history
-        if isinstance(rating1, tuple) and len(rating1) == 2:
-            total1, history1 = rating1
-        else:
-            total1, history1 = rating1, []
+        # Simple sigmoid function to convert the strength difference to probability
+        point_diff = self._blended_strength(rating1) - self._blended_strength(rating2)
+        return 1.0 / (1.0 + math.exp(-point_diff / 100.0))
+    
+    def expected_outcome_matrix(self, ratings: List[Union[float, Tuple[float, List[float]]]]) -> np.ndarray:
+        """
+        Estimate outscoring probabilities for every pair of participants at once.
+        
+        Entry [i, j] equals expected_outcome(ratings[i], ratings[j]), but the whole
+        matrix is computed with one broadcast subtraction and one vectorized exp.
+        
+        Args:
+            ratings: List of (total_points, points_history) or just total_points
             
-        if isinstance(rating2, tuple) and len(rating2) == 2:
-            total2, history2 = rating2
+        Returns:
+            Square array of probabilities (0-1) of row participant outscoring column participant
+        """
+        strengths = np.fromiter((self._blended_strength(rating) for rating in ratings),
+                                dtype=np.float64, count=len(ratings))
+        
+        # Same sigmoid as expected_outcome; huge gaps saturate to 0/1 instead of overflowing
+        point_diff = strengths[:, None] - strengths[None, :]
+        with np.errstate(over='ignore'):
+            return 1.0 / (1.0 + np.exp(-point_diff / 100.0))
+    
+    def _blended_strength(self, rating: Union[float, Tuple[float, List[float]]]) -> float:
+        """
+        Blend a participant's total points with their recent performance.
+        
+        Args:
+            rating: (total_points, points_history) or just total_points
+            
+        Returns:
+            Strength used by expected_outcome (just the total if no history weight is set)
+        """
+        # Extract total points and history
+        if isinstance(rating, tuple) and len(rating) == 2:
+            total, history = rating
         else:
-            total2, history2 = rating2, []
+            total, history = rating, []
         
         # If no history weight is set, just compare total points
         if self.points_history_weight == 0.0:
-            # Simple sigmoid function to convert point difference to probability
-            point_diff = total1 - total2
-            return 1.0 / (1.0 + math.exp(-point_diff / 100.0))
-        
-        # Get recent performance for both participants
-        recent1 = history1[-self.weekly_average_window:] if history1 else [total1 / 10]
-        recent2 = history2[-self.weekly_average_window:] if history2 else [total2 / 10]
+            return total
         
-        # Calculate average recent performance
-        avg_recent1 = sum(recent1) / len(recent1) if recent1 else 0
-        avg_recent2 = sum(recent2) / len(recent2) if recent2 else 0
+        # Average recent performance; without history, assume a tenth of the total per event
+        recent = history[-self.weekly_average_window:] if history else [total / 10]
+        avg_recent = sum(recent) / len(recent)
         
         # Blend total points with recent performance
-        blended1 = (1 - self.points_history_weight) * total1 + self.points_history_weight * avg_recent1 * 10
-        blended2 = (1 - self.points_history_weight) * total2 + self.points_history_weight * avg_recent2 * 10
-        
-        # Convert to probability
-        point_diff = blended1 - blended2
-        return 1.0 / (1.0 + math.exp(-point_diff / 100.0))
+        return (1 - self.points_history_weight) * total + self.points_history_weight * avg_recent * 10
     
-    def get_default_rating(self) -> Tuple[float, List[float]]:
+    def get_default_rating(self) -> PointsRating:
         """
         Get the default rating for new participants.
         
         Returns:
-            Tuple of (default_points, empty_history)
+            PointsRating of (default_points, empty_history)
         """
-        return (self._default_points, [])
+        return PointsRating(self._default_points, [])
     
     def get_display_name(self) -> str:
         """
@@ -163,13 +686,11 @@ class PointsBasedRankingSystem(RatingSystem):
         Returns:
             Display name of the rating system
         """
-        if self.rank_points is not None:
-            return "Points-Based (Ranked)"
-        return "Points-Based"
+        return self._display_name
     
     def project_season_finish(self, current_rating: Tuple[float, List[float]], 
                              remaining_events: int, 
-                             confidence_level: float = 0.95) -> Dict[str, float]:
+                             confidence_level: float = 0.95) -> Projection:
         """
         Project the final season points and potential range.
         
@@ -179,25 +700,25 @@ class PointsBasedRankingSystem(RatingSystem):
             confidence_level: Confidence level for the projection range (0-1)
             
         Returns:
-            Dictionary with projected points, min, max, and confidence interval
+            Projection with projected points, min, max, and confidence interval
+            (supports dict-style reads such as projection["projected_points"] and get();
+            use to_dict() for a real dictionary)
         """
         total_points, points_history = current_rating
         
         if not points_history:
-            return {
-                "projected_points": total_points,
-                "min_points": total_points,
-                "max_points": total_points,
-                "lower_bound": total_points,
-                "upper_bound": total_points
-            }
+            return Projection(total_points, total_points, total_points, total_points, total_points)
+        
+        # Convert the history once; mean, spread and extremes are then reduced in NumPy
+        history = np.asarray(points_history, dtype=np.float64)
+        n_events = history.size
         
         # Calculate average points per event
-        avg_points = sum(points_history) / len(points_history)
+        avg_points = float(history.mean())
         
-        # Calculate standard deviation
-        if len(points_history) > 1:
-            std_dev = statistics.stdev(points_history)
+        # Calculate standard deviation (sample standard deviation, as statistics.stdev)
+        if n_events > 1:
+            std_dev = float(history.std(ddof=1))
         else:
             # Default to 20% of average if only one data point
             std_dev = avg_points * 0.2
@@ -207,32 +728,78 @@ class PointsBasedRankingSystem(RatingSystem):
         projected_total = total_points + projected_additional
         
         # Calculate confidence interval
-        # For 95% confidence, use ~2 standard deviations
-        z_score = 1.96 if confidence_level == 0.95 else 1.645 if confidence_level == 0.90 else 2.576
-        margin = z_score * (std_dev / math.sqrt(len(points_history))) * math.sqrt(remaining_events)
+        margin = _z_score(confidence_level) * (std_dev / math.sqrt(n_events)) * math.sqrt(remaining_events)
         
         # Calculate bounds
         lower_bound = projected_total - margin
         upper_bound = projected_total + margin
         
         # Calculate min/max scenarios (best/worst case based on history)
-        if len(points_history) > 0:
-            min_points_per_event = min(points_history)
-            max_points_per_event = max(points_history)
-        else:
-            min_points_per_event = avg_points * 0.5
-            max_points_per_event = avg_points * 1.5
-            
+        min_points_per_event = float(history.min())
+        max_points_per_event = float(history.max())
+        
         min_projected = total_points + (min_points_per_event * remaining_events)
         max_projected = total_points + (max_points_per_event * remaining_events)
         
-        return {
-            "projected_points": projected_total,
-            "min_points": min_projected,
-            "max_points": max_projected,
-            "lower_bound": max(lower_bound, min_projected),
-            "upper_bound": min(upper_bound, max_projected)
-        }
+        return Projection(
+            projected_points=projected_total,
+            min_points=min_projected,
+            max_points=max_projected,
+            lower_bound=max(lower_bound, min_projected),
+            upper_bound=min(upper_bound, max_projected)
+        )
+    
+    def project_season_finish_many(self, ratings: List[Tuple[float, List[float]]],
+                                   remaining_events: int,
+                                   confidence_level: float = 0.95) -> np.recarray:
+        """
+        Project the final season points for many participants at once.
+        
+        All histories are concatenated into one array and reduced per participant
+        with segmented NumPy reductions; row i equals project_season_finish(ratings[i], ...).
+        
+        Args:
+            ratings: List of (total_points, points_history)
+            remaining_events: Number of events remaining in the season
+            confidence_level: Confidence level for the projection range (0-1)
+            
+        Returns:
+            Record array with one row per participant and the Projection fields as columns
+        """
+        totals = np.fromiter((rating[0] for rating in ratings), dtype=np.float64, count=len(ratings))
+        counts = np.fromiter((len(rating[1]) for rating in ratings), dtype=np.intp, count=len(ratings))
+        
+        # Participants without history keep their current total everywhere
+        columns = {field: totals.copy() for field in Projection._fields}
+        
+        active = np.flatnonzero(counts)
+        if active.size:
+            n_events = counts[active]
+            starts = np.concatenate(([0], np.cumsum(n_events)[:-1]))
+            history = np.concatenate([np.asarray(ratings[i][1], dtype=np.float64) for i in active])
+            current = totals[active]
+            
+            # Per-participant mean, sample standard deviation, min and max
+            avg_points = np.add.reduceat(history, starts) / n_events
+            deviations = history - np.repeat(avg_points, n_events)
+            squared = np.add.reduceat(deviations * deviations, starts)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                std_dev = np.where(n_events > 1, np.sqrt(squared / (n_events - 1)), avg_points * 0.2)
+            min_projected = current + np.minimum.reduceat(history, starts) * remaining_events
+            max_projected = current + np.maximum.reduceat(history, starts) * remaining_events
+            
+            # Projection and confidence interval, clipped to the min/max scenarios
+            projected_total = current + avg_points * remaining_events
+            margin = _z_score(confidence_level) * (std_dev / np.sqrt(n_events)) * math.sqrt(remaining_events)
+            
+            columns["projected_points"][active] = projected_total
+            columns["min_points"][active] = min_projected
+            columns["max_points"][active] = max_projected
+            columns["lower_bound"][active] = np.maximum(projected_total - margin, min_projected)
+            columns["upper_bound"][active] = np.minimum(projected_total + margin, max_projected)
+        
+        return np.rec.fromarrays([columns[field] for field in Projection._fields],
+                                 names=list(Projection._fields))
     
     def get_trend(self, points_history: List[float], window: int = 3) -> str:
         """
@@ -258,13 +825,8 @@ class PointsBasedRankingSystem(RatingSystem):
         # Calculate percent change
         percent_change = (recent_avg - previous_avg) / previous_avg if previous_avg > 0 else 0
         
-        # Determine trend
-        if percent_change > 0.1:  # 10% improvement
-            return "up"
-        elif percent_change < -0.1:  # 10% decline
-            return "down"
-        else:
-            return "stable"
+        # Determine trend: +1 for a 10% improvement, -1 for a 10% decline, 0 otherwise
+        return _TREND_LABELS[int(percent_change > 0.1) - int(percent_change < -0.1) + 1]
     
     def rank_participants(self, ratings: Dict[str, Tuple[float, List[float]]]) -> List[Tuple[str, float]]:
         """
@@ -276,12 +838,20 @@ class PointsBasedRankingSystem(RatingSystem):
         Returns:
             List of (participant_id, total_points) sorted by points (highest first)
         """
-        # Sort by total points (first element of the tuple)
-        return sorted(
-            [(pid, rating[0]) for pid, rating in ratings.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )
+        return PlayerTable.from_ratings(ratings).rank()
+    
+    def top_k(self, ratings: Dict[str, Tuple[float, List[float]]], k: int) -> List[Tuple[str, float]]:
+        """
+        Rank the k highest-scoring participants without sorting everyone.
+        
+        Args:
+            ratings: Dictionary mapping participant IDs to their (total_points, history)
+            k: Number of participants to return
+            
+        Returns:
+            The first k entries of rank_participants(ratings)
+        """
+        return PlayerTable.from_ratings(ratings).top_k(k)
 
 
 # Register the Points-based ranking system
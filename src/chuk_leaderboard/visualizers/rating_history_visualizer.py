@@ -1,5 +1,9 @@
 # chuk_leaderboard/visualizers/rating_history_visualizer.py
+import sys
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 from typing import Dict, List, Any, Optional, Tuple
 
 # imports
@@ -13,6 +17,13 @@ class RatingHistoryVisualizer(RatingVisualizer):
     def __init__(self, title: str = "Rating History", output_dir: str = "output"):
         super().__init__(title, output_dir)
         self.history: Dict[str, Dict[str, List]] = {}
+        
+        # Whether any participant has a non-zero RD / volatility, kept up to date by track*
+        self._any_rd = False
+        self._any_vol = False
+        
+        # Longest history tracked for any participant
+        self._max_length = 0
     
     def track(self, name: str, rating_data: Any) -> None:
         """
@@ -22,16 +33,11 @@ class RatingHistoryVisualizer(RatingVisualizer):
             name: Participant name
             rating_data: Rating data in any supported format
         """
-        if name not in self.history:
-            self.history[name] = {"ratings": [], "rds": [], "vols": []}
-        
         # Convert rating data to standard format
         rating, rd, vol = self._convert_to_display_format(rating_data)
         
         # Track the values
-        self.history[name]["ratings"].append(rating)
-        self.history[name]["rds"].append(rd)
-        self.history[name]["vols"].append(vol)
+        self.track_with_explicit_values(name, rating, rd, vol)
     
     def track_with_explicit_values(self, name: str, rating: float, rd: float, vol: float) -> None:
         """
@@ -49,6 +55,44 @@ class RatingHistoryVisualizer(RatingVisualizer):
         self.history[name]["ratings"].append(rating)
         self.history[name]["rds"].append(rd)
         self.history[name]["vols"].append(vol)
+        self._max_length = max(self._max_length, len(self.history[name]["ratings"]))
+        
+        if rd > 0:
+            self._any_rd = True
+        if vol > 0:
+            self._any_vol = True
+    
+    def _plot_series(self, ax: plt.Axes, key: str, marker: str) -> List[Line2D]:
+        """
+        Draw one tracked series for every participant as a single line collection.
+        
+        Args:
+            ax: Axes to draw on
+            key: History key to plot ("ratings", "rds" or "vols")
+            marker: Marker style for the data points
+            
+        Returns:
+            Legend handles, one per participant
+        """
+        names = list(self.history)
+        if not names:
+            return []
+        
+        colors = plt.cm.tab10(np.arange(len(names)) % 10)
+        segments = [
+            np.column_stack((np.arange(len(data[key])), data[key]))
+            for data in self.history.values()
+        ]
+        ax.add_collection(LineCollection(segments, colors=colors))
+        
+        # Markers for all participants in one scatter call
+        points = np.concatenate(segments)
+        point_colors = np.repeat(colors, [len(segment) for segment in segments], axis=0)
+        ax.scatter(points[:, 0], points[:, 1], c=point_colors, marker=marker)
+        ax.autoscale()
+        
+        return [Line2D([], [], color=color, marker=marker, label=name)
+                for name, color in zip(names, colors)]
     
     def plot(self, figsize: Tuple[int, int] = (12, 8), show_volatility: bool = True,
              show_rd: bool = True) -> None:
@@ -60,7 +104,7 @@ class RatingHistoryVisualizer(RatingVisualizer):
             show_volatility: Whether to show the volatility subplot
             show_rd: Whether to show the rating deviation subplot
         """
-        plt.figure(figsize=figsize)
+        fig = plt.figure(figsize=figsize)
         
         # Determine number of subplots
         n_plots = 1
@@ -68,59 +112,55 @@ class RatingHistoryVisualizer(RatingVisualizer):
             n_plots += 1
         if show_volatility:
             n_plots += 1
+        
+        # Create all axes in one call
+        axes = iter(fig.subplots(n_plots, 1, squeeze=False)[:, 0])
             
         # Always plot ratings
-        plt.subplot(n_plots, 1, 1)
-        for name, data in self.history.items():
-            plt.plot(data["ratings"], marker='o', label=name)
-        plt.title(f"{self.title}")
-        plt.ylabel("Rating")
-        plt.grid(True)
-        plt.legend()
-        
-        current_plot = 1
+        ax = next(axes)
+        handles = self._plot_series(ax, "ratings", 'o')
+        ax.set_title(f"{self.title}")
+        ax.set_ylabel("Rating")
+        ax.grid(True)
+        ax.legend(handles=handles)
         
         # Plot rating deviations if requested
         if show_rd:
-            current_plot += 1
-            plt.subplot(n_plots, 1, current_plot)
+            ax = next(axes)
             
             # Check if we have meaningful RD values to plot
-            has_rd = any(sum(data["rds"]) > 0 for data in self.history.values())
+            has_rd = self._any_rd
             
             if has_rd:
-                for name, data in self.history.items():
-                    plt.plot(data["rds"], marker='s', label=name)
-                plt.title("Rating Deviation")
-                plt.ylabel("RD")
-                plt.grid(True)
+                self._plot_series(ax, "rds", 's')
+                ax.set_title("Rating Deviation")
+                ax.set_ylabel("RD")
+                ax.grid(True)
             else:
-                plt.text(0.5, 0.5, "Rating Deviation not available", 
+                ax.text(0.5, 0.5, "Rating Deviation not available", 
                         horizontalalignment='center', verticalalignment='center',
-                        transform=plt.gca().transAxes)
-                plt.axis('off')
+                        transform=ax.transAxes)
+                ax.axis('off')
         
         # Plot volatility if requested
         if show_volatility:
-            current_plot += 1
-            plt.subplot(n_plots, 1, current_plot)
+            ax = next(axes)
             
             # Check if we have meaningful volatility values to plot
-            has_vol = any(sum(data["vols"]) > 0 for data in self.history.values())
+            has_vol = self._any_vol
             
             if has_vol:
-                for name, data in self.history.items():
-                    plt.plot(data["vols"], marker='^', label=name)
-                plt.title("Volatility")
-                plt.ylabel("Volatility")
-                plt.grid(True)
+                self._plot_series(ax, "vols", '^')
+                ax.set_title("Volatility")
+                ax.set_ylabel("Volatility")
+                ax.grid(True)
             else:
-                plt.text(0.5, 0.5, "Volatility not available", 
+                ax.text(0.5, 0.5, "Volatility not available", 
                         horizontalalignment='center', verticalalignment='center',
-                        transform=plt.gca().transAxes)
-                plt.axis('off')
+                        transform=ax.transAxes)
+                ax.axis('off')
         
-        plt.xlabel("Match Number")
+        ax.set_xlabel("Match Number")
         plt.tight_layout()
     
     def get_final_ratings(self) -> Dict[str, Dict[str, float]]:
@@ -150,14 +190,13 @@ class RatingHistoryVisualizer(RatingVisualizer):
             print("No rating history to display")
             return
             
-        first_participant = next(iter(self.history.values()))
-        max_length = len(first_participant["ratings"])
-        
+        # Collect all rows and write them in one go rather than printing line by line
+        lines = []
         for interval in intervals:
-            if interval >= max_length:
+            if interval >= self._max_length:
                 continue
                 
-            print(f"\nRatings after match/round {interval}:")
+            lines.append(f"\nRatings after match/round {interval}:")
             for name, data in self.history.items():
                 if interval < len(data["ratings"]):
                     # Check if we have meaningful RD and volatility
@@ -166,11 +205,14 @@ class RatingHistoryVisualizer(RatingVisualizer):
                     
                     # Format output based on what data we have
                     if has_rd and has_vol:
-                        print(f"{name}: Rating = {data['ratings'][interval]:.1f}, "
-                              f"RD = {data['rds'][interval]:.1f}, "
-                              f"Vol = {data['vols'][interval]:.4f}")
+                        lines.append(f"{name}: Rating = {data['ratings'][interval]:.1f}, "
+                                     f"RD = {data['rds'][interval]:.1f}, "
+                                     f"Vol = {data['vols'][interval]:.4f}")
                     elif has_rd:
-                        print(f"{name}: Rating = {data['ratings'][interval]:.1f}, "
-                              f"RD = {data['rds'][interval]:.1f}")
+                        lines.append(f"{name}: Rating = {data['ratings'][interval]:.1f}, "
+                                     f"RD = {data['rds'][interval]:.1f}")
                     else:
-                        print(f"{name}: Rating = {data['ratings'][interval]:.1f}")
\ No newline at end of file
+                        lines.append(f"{name}: Rating = {data['ratings'][interval]:.1f}")
+        
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
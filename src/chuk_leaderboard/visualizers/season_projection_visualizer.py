@@ -2,13 +2,34 @@
 import matplotlib.pyplot as plt
 import numpy as np
 from typing import Dict, List, Tuple, Any, Optional
-from tabulate import tabulate
-import matplotlib.patches as mpatches
 
 # imports
 from chuk_leaderboard.visualizers.rating_visualizer import RatingVisualizer
 
 
+def _compute_trend(points_history: np.ndarray) -> str:
+    """
+    Classify recent form by comparing the last three weeks with the three before.
+    
+    Args:
+        points_history: Array of weekly point values
+        
+    Returns:
+        Trend marker: "▲" (up), "▼" (down) or "◆" (stable)
+    """
+    if points_history.size < 6:  # Need at least 6 weeks to determine trend
+        return "◆"
+    
+    recent_avg = points_history[-3:].mean()
+    previous_avg = points_history[-6:-3].mean()
+    
+    if recent_avg > previous_avg * 1.1:
+        return "▲"  # Up
+    if recent_avg < previous_avg * 0.9:
+        return "▼"  # Down
+    return "◆"  # Stable
+
+
 class SeasonProjectionVisualizer(RatingVisualizer):
     """
     Visualizer for season projections in points-based leagues.
@@ -30,6 +51,14 @@ class SeasonProjectionVisualizer(RatingVisualizer):
         self.current_week = current_week
         self.history = {}
         self.league_name = "League"
+        
+        # Legend proxies for plot_projection_ranges never change, so they are built once on first use
+        self._range_legend_handles: Optional[List[Any]] = None
+        
+        # Participant orderings shared by the plot/table methods, rebuilt lazily after changes
+        self._sorted_names_by_projected: List[str] = []
+        self._sorted_names_by_current: List[str] = []
+        self._sort_dirty = True
     
     def set_league_info(self, league_name: str, weeks_in_season: int, current_week: int):
         """
@@ -53,13 +82,49 @@ class SeasonProjectionVisualizer(RatingVisualizer):
             name: Participant name
             current_points: Current total points
             points_history: List of weekly point values
-            projection: Dictionary with projection data (from PointsBasedRankingSystem.project_season_finish)
+            projection: Projection data readable by key, e.g. the Projection returned by
+                        PointsBasedRankingSystem.project_season_finish (or an equivalent dictionary)
         """
+        # Store the weekly history as a contiguous array once so later reductions stay in NumPy
+        points_history = np.asarray(points_history, dtype=np.float64)
+        
         self.projections[name] = projection
         self.history[name] = {
-            "current_points": current_points,
-            "points_history": points_history
+            "current_points": float(current_points),
+            "points_history": points_history,
+            "trend": _compute_trend(points_history)
         }
+        self._sort_dirty = True
+    
+    def _refresh_sort(self):
+        """Recompute the cached participant orderings if participants have changed."""
+        if not self._sort_dirty:
+            return
+        
+        self._sorted_names_by_projected = sorted(
+            self.projections, key=lambda name: self.projections[name]["projected_points"], reverse=True)
+        self._sorted_names_by_current = sorted(
+            self.history, key=lambda name: self.history[name]["current_points"], reverse=True)
+        self._sort_dirty = False
+    
+    def _gather_columns(self, names: List[str], keys: Tuple[str, ...]) -> List[List[float]]:
+        """
+        Collect current points and the requested projection fields in a single pass.
+        
+        Args:
+            names: Participant names, in the desired order
+            keys: Projection dictionary keys to extract
+            
+        Returns:
+            List of columns: current points followed by one column per key
+        """
+        rows = [
+            (self.history[name]["current_points"], *(self.projections[name][key] for key in keys))
+            for name in names
+        ]
+        if not rows:
+            return [[] for _ in range(len(keys) + 1)]
+        return [list(column) for column in zip(*rows)]
     
     def plot_projections(self, figsize: Tuple[int, int] = (12, 8), confidence_level: float = 0.95):
         """
@@ -72,17 +137,10 @@ class SeasonProjectionVisualizer(RatingVisualizer):
         plt.figure(figsize=figsize)
         
         # Sort participants by projected points
-        sorted_participants = sorted(
-            [(name, data["projected_points"]) for name, data in self.projections.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )
-        
-        names = [item[0] for item in sorted_participants]
-        projected = [self.projections[name]["projected_points"] for name in names]
-        lower = [self.projections[name]["lower_bound"] for name in names]
-        upper = [self.projections[name]["upper_bound"] for name in names]
-        current = [self.history[name]["current_points"] for name in names]
+        self._refresh_sort()
+        names = self._sorted_names_by_projected
+        current, projected, lower, upper = self._gather_columns(
+            names, ("projected_points", "lower_bound", "upper_bound"))
         
         # Calculate error bars
         yerr_lower = [p - l for p, l in zip(projected, lower)]
@@ -119,55 +177,37 @@ class SeasonProjectionVisualizer(RatingVisualizer):
         plt.figure(figsize=figsize)
         
         # Prepare data
-        max_history_len = max([len(data["points_history"]) for data in self.history.values()], default=0)
+        max_history_len = max([data["points_history"].size for data in self.history.values()], default=0)
         week_labels = [f"Week {i+1}" for i in range(max_history_len)]
         
         # Sort participants by current points
-        sorted_participants = sorted(
-            [(name, data["current_points"]) for name, data in self.history.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )
+        self._refresh_sort()
+        names = self._sorted_names_by_current
         
-        names = [item[0] for item in sorted_participants]
-        
-        # Plot each participant's weekly performance
-        for name in names:
+        # Stack histories into a NaN-padded (participants x weeks) array
+        weekly = np.full((len(names), max_history_len), np.nan)
+        for row, name in zip(weekly, names):
             points = self.history[name]["points_history"]
-            weeks = list(range(1, len(points) + 1))
-            
-            # Split into normal and highlighted sections
-            if highlight_recent > 0 and len(points) > highlight_recent:
-                normal_weeks = weeks[:-highlight_recent]
-                normal_points = points[:-highlight_recent]
-                
-                recent_weeks = weeks[-highlight_recent:]
-                recent_points = points[-highlight_recent:]
+            row[:points.size] = points
+        weeks = np.arange(1, max_history_len + 1)
+        
+        # Plot every participant's weekly performance with one call per section
+        if names:
+            if 0 < highlight_recent < max_history_len:
+                split = max_history_len - highlight_recent
                 
                 # Plot regular history
-                plt.plot(normal_weeks, normal_points, 'o-', alpha=0.6, label=name if normal_weeks else None)
+                plt.plot(weeks[:split], weekly[:, :split].T, 'o-', alpha=0.6, label=names)
                 
-                # Plot highlighted recent performance with thicker line
-                plt.plot(recent_weeks, recent_points, 'o-', linewidth=3, 
-                        label=None if normal_weeks else name)
+                # Plot highlighted recent performance with thicker line, reusing each participant's colour
+                plt.gca().set_prop_cycle(None)
+                plt.plot(weeks[split:], weekly[:, split:].T, 'o-', linewidth=3)
             else:
-                plt.plot(weeks, points, 'o-', label=name)
+                plt.plot(weeks, weekly.T, 'o-', label=names)
         
         # Add league average if we have enough data
         if max_history_len > 0:
-            all_points = []
-            for week in range(max_history_len):
-                week_points = []
-                for name in self.history:
-                    if week < len(self.history[name]["points_history"]):
-                        week_points.append(self.history[name]["points_history"][week])
-                
-                if week_points:
-                    all_points.append(sum(week_points) / len(week_points))
-                else:
-                    all_points.append(0)
-            
-            plt.plot(range(1, len(all_points) + 1), all_points, 'k--', linewidth=2, label='League Average')
+            plt.plot(weeks, np.nanmean(weekly, axis=0), 'k--', linewidth=2, label='League Average')
         
         # Customize the plot
         plt.xlabel('Week')
@@ -187,17 +227,10 @@ class SeasonProjectionVisualizer(RatingVisualizer):
         plt.figure(figsize=figsize)
         
         # Sort participants by projected points
-        sorted_participants = sorted(
-            [(name, data["projected_points"]) for name, data in self.projections.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )
-        
-        names = [item[0] for item in sorted_participants]
-        current = [self.history[name]["current_points"] for name in names]
-        projected = [self.projections[name]["projected_points"] for name in names]
-        min_points = [self.projections[name]["min_points"] for name in names]
-        max_points = [self.projections[name]["max_points"] for name in names]
+        self._refresh_sort()
+        names = self._sorted_names_by_projected
+        current, projected, min_points, max_points = self._gather_columns(
+            names, ("projected_points", "min_points", "max_points"))
         
         # Create positions for bars
         pos = np.arange(len(names))
@@ -209,25 +242,21 @@ class SeasonProjectionVisualizer(RatingVisualizer):
         # Plot projected points
         plt.bar(pos + width/2, projected, width=width, color='darkblue', label='Projected')
         
-        # Add min/max range lines
-        for i, name in enumerate(names):
-            plt.plot([pos[i] + width/2, pos[i] + width/2], 
-                    [min_points[i], max_points[i]], 
-                    'r-', linewidth=2)
-            
-            plt.plot([pos[i] + width/2 - 0.1, pos[i] + width/2 + 0.1], 
-                    [min_points[i], min_points[i]], 
-                    'r-', linewidth=2)
-                    
-            plt.plot([pos[i] + width/2 - 0.1, pos[i] + width/2 + 0.1], 
-                    [max_points[i], max_points[i]], 
-                    'r-', linewidth=2)
-        
-        # Add a legend element for the min/max range
-        red_patch = mpatches.Patch(color='red', label='Min/Max Range')
-        plt.legend(handles=[plt.Rectangle((0,0),1,1,color='lightblue', ec="k"), 
-                          plt.Rectangle((0,0),1,1,color='darkblue', ec="k"),
-                          red_patch])
+        # Add min/max range lines (one collection per element rather than one line per participant)
+        range_x = pos + width/2
+        plt.vlines(range_x, min_points, max_points, colors='r', linewidth=2)
+        plt.hlines(min_points, range_x - 0.1, range_x + 0.1, colors='r', linewidth=2)
+        plt.hlines(max_points, range_x - 0.1, range_x + 0.1, colors='r', linewidth=2)
+        
+        # Add a legend including an element for the min/max range
+        if self._range_legend_handles is None:
+            import matplotlib.patches as mpatches
+            self._range_legend_handles = [
+                mpatches.Rectangle((0, 0), 1, 1, color='lightblue', ec="k", label='Current'),
+                mpatches.Rectangle((0, 0), 1, 1, color='darkblue', ec="k", label='Projected'),
+                mpatches.Patch(color='red', label='Min/Max Range')
+            ]
+        plt.legend(handles=self._range_legend_handles)
         
         # Customize the plot
         plt.xlabel('Participant')
@@ -239,34 +268,20 @@ class SeasonProjectionVisualizer(RatingVisualizer):
     
     def print_projection_table(self):
         """Print a table of projections sorted by projected finish."""
-        sorted_participants = sorted(
-            [(name, self.projections[name]["projected_points"]) for name in self.projections],
-            key=lambda x: x[1],
-            reverse=True
-        )
+        from tabulate import tabulate
+        
+        self._refresh_sort()
         
         table_data = []
-        for rank, (name, _) in enumerate(sorted_participants, 1):
+        for rank, name in enumerate(self._sorted_names_by_projected, 1):
             proj = self.projections[name]
             current = self.history[name]["current_points"]
             
             # Calculate projected points to be gained
             to_gain = proj["projected_points"] - current
             
-            # Determine trend based on recent performance
-            points_history = self.history[name]["points_history"]
-            if len(points_history) >= 6:  # Need at least 6 weeks to determine trend
-                recent_avg = sum(points_history[-3:]) / 3
-                previous_avg = sum(points_history[-6:-3]) / 3
-                
-                if recent_avg > previous_avg * 1.1:
-                    trend = "▲"  # Up
-                elif recent_avg < previous_avg * 0.9:
-                    trend = "▼"  # Down
-                else:
-                    trend = "◆"  # Stable
-            else:
-                trend = "◆"  # Default to stable if not enough data
+            # Trend is computed once when the participant is added
+            trend = self.history[name]["trend"]
             
             # Format confidence interval
             confidence = f"{proj['lower_bound']:.1f} - {proj['upper_bound']:.1f}"
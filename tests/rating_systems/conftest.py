@@ -0,0 +1,144 @@
+import math
+import numpy as np
+import pytest
+from chuk_leaderboard.rating_systems.elo import EloRatingSystem
+from chuk_leaderboard.rating_systems.glicko2 import Glicko2RatingSystem
+from chuk_leaderboard.rating_systems.points_based import PointsBasedRankingSystem
+
+
+@pytest.fixture(scope="module")
+def elo_default():
+    """
+    Elo rating system with default settings, shared across a test module.
+    """
+    return EloRatingSystem()
+
+
+@pytest.fixture(scope="module")
+def glicko2_default():
+    """
+    Glicko-2 rating system with default settings, shared across a test module.
+    """
+    return Glicko2RatingSystem()
+
+
+@pytest.fixture(scope="module", params=[0.2, 0.3, 0.5, 0.8, 1.2])
+def glicko2_tau(request):
+    """
+    Glicko-2 rating system for a sweep of tau values across and just below
+    the typical 0.3-1.2 range.
+    """
+    return Glicko2RatingSystem(tau=request.param)
+
+
+@pytest.fixture(scope="module")
+def points_default():
+    """
+    Points-based ranking system with default settings, shared across a test module.
+    """
+    return PointsBasedRankingSystem()
+
+
+# Reference implementations, exposed to tests through the oracle fixtures below
+
+# Elo logistic slope: 10^(x/400) == exp(_ELO_ALPHA * x)
+_ELO_ALPHA = math.log(10) / 400.0
+
+# Glicko-2 scale conversion constants (Glickman, "Example of the Glicko-2 system")
+_GLICKO2_SCALE = 173.7178
+_GLICKO2_BASE = 1500.0
+
+
+def elo_expected_score(rating, opponent):
+    """
+    Reference Elo expected score 1 / (1 + 10^((opponent - rating) / 400)).
+    
+    Args:
+        rating: Player rating (scalar or array)
+        opponent: Opponent rating (scalar or array, broadcast against rating)
+        
+    Returns:
+        Expected score of the player against the opponent
+    """
+    return 1.0 / (1.0 + np.exp(_ELO_ALPHA * (np.asarray(opponent, dtype=np.float64) - rating)))
+
+
+def elo_update(rating: float, opps: np.ndarray, results: np.ndarray, k: float) -> float:
+    """
+    Reference Elo update for one rating period.
+    
+    Every expected score is taken against the pre-period rating.
+    
+    Args:
+        rating: Rating before the period
+        opps: Array of opponent ratings
+        results: Array of results (1 win, 0.5 draw, 0 loss)
+        k: K-factor
+        
+    Returns:
+        Rating after the period
+    """
+    results = np.asarray(results, dtype=np.float64)
+    return float(rating + k * np.sum(results - elo_expected_score(rating, opps)))
+
+
+def glicko2_update(rating: float, rd: float, new_vol: float,
+                   opp_ratings: np.ndarray, opp_rds: np.ndarray,
+                   results: np.ndarray) -> tuple:
+    """
+    Reference Glicko-2 rating and RD update for one rating period.
+    
+    Implements steps 2-4 and 6-8 of the Glicko-2 algorithm. The volatility
+    step is left to the system under test, so its chosen volatility is
+    passed in.
+    
+    Args:
+        rating: Rating before the period
+        rd: Rating deviation before the period
+        new_vol: Volatility after the period
+        opp_ratings: Array of opponent ratings
+        opp_rds: Array of opponent rating deviations
+        results: Array of results (1 win, 0.5 draw, 0 loss)
+        
+    Returns:
+        Tuple of (new_rating, new_rd)
+    """
+    mu = (rating - _GLICKO2_BASE) / _GLICKO2_SCALE
+    phi = rd / _GLICKO2_SCALE
+    opp_mu = (np.asarray(opp_ratings, dtype=np.float64) - _GLICKO2_BASE) / _GLICKO2_SCALE
+    opp_phi = np.asarray(opp_rds, dtype=np.float64) / _GLICKO2_SCALE
+    results = np.asarray(results, dtype=np.float64)
+    
+    g = 1.0 / np.sqrt(1.0 + 3.0 * opp_phi ** 2 / np.pi ** 2)
+    E = 1.0 / (1.0 + np.exp(-g * (mu - opp_mu)))
+    v = 1.0 / np.sum(g ** 2 * E * (1.0 - E))
+    
+    phi_star = np.sqrt(phi ** 2 + new_vol ** 2)
+    new_phi = 1.0 / np.sqrt(1.0 / phi_star ** 2 + 1.0 / v)
+    new_mu = mu + new_phi ** 2 * np.sum(g * (results - E))
+    
+    return float(_GLICKO2_SCALE * new_mu + _GLICKO2_BASE), float(_GLICKO2_SCALE * new_phi)
+
+
+@pytest.fixture(scope="session")
+def elo_expected():
+    """
+    Reference Elo expected score (see elo_expected_score).
+    """
+    return elo_expected_score
+
+
+@pytest.fixture(scope="session")
+def elo_oracle():
+    """
+    Reference Elo update for one rating period (see elo_update).
+    """
+    return elo_update
+
+
+@pytest.fixture(scope="session")
+def glicko2_oracle():
+    """
+    Reference Glicko-2 rating and RD update for one rating period (see glicko2_update).
+    """
+    return glicko2_update
@@ -1,4 +1,4 @@
-import math
+import numpy as np
 import pytest
 from chuk_leaderboard.rating_systems.elo import EloRatingSystem
 
@@ -17,15 +17,17 @@ def test_get_default_rating():
     assert custom_default == 2000
 
 
-def test_get_display_name():
+@pytest.mark.parametrize("k_factor, expected_name", [
+    (16, "Elo (K=16)"),
+    (20, "Elo (K=20)"),
+    (24, "Elo (K=24)"),
+    (32, "Elo (K=32)"),
+])
+def test_get_display_name(k_factor, expected_name):
     """
     Test that the display name includes the K-factor.
     """
-    elo = EloRatingSystem(k_factor=32)
-    assert elo.get_display_name() == "Elo (K=32)"
-    
-    elo2 = EloRatingSystem(k_factor=16)
-    assert elo2.get_display_name() == "Elo (K=16)"
+    assert EloRatingSystem(k_factor=k_factor).get_display_name() == expected_name
 
 
 def test_no_outcomes():
@@ -40,15 +42,15 @@ def test_no_outcomes():
     assert new_rating == rating
 
 
-def test_expected_outcome():
+def test_expected_outcome(elo_default):
     """
     Test the expected outcome computation between two players with distinct ratings.
     """
-    elo = EloRatingSystem()
+    elo = elo_default
     
     # Test: equal ratings should result in 0.5 win probability
     equal_probability = elo.expected_outcome(1500, 1500)
-    assert math.isclose(equal_probability, 0.5, abs_tol=1e-6)
+    assert equal_probability == pytest.approx(0.5, abs=1e-6)
     
     # Test: higher rating should have higher win probability
     higher_probability = elo.expected_outcome(1600, 1400)
@@ -61,11 +63,10 @@ def test_expected_outcome():
     # Test: symmetry property - P(A beats B) + P(B beats A) should be 1
     p_a_beats_b = elo.expected_outcome(1700, 1500)
     p_b_beats_a = elo.expected_outcome(1500, 1700)
-    assert math.isclose(p_a_beats_b + p_b_beats_a, 1.0, abs_tol=1e-6)
+    assert p_a_beats_b + p_b_beats_a == pytest.approx(1.0, abs=1e-6)
 
 
-@pytest.mark.parametrize("result", [1.0, 0.5, 0.0])
-def test_calculate_rating_single_outcome(result):
+def test_calculate_rating_single_outcome(elo_expected):
     """
     Test calculate_rating when a single match outcome is provided.
     We test for a win (result = 1), draw (result = 0.5), and loss (result = 0).
@@ -73,28 +74,26 @@ def test_calculate_rating_single_outcome(result):
     elo = EloRatingSystem(k_factor=32)
     rating = 1500
     opponent_rating = 1500
+    results = np.array([1.0, 0.5, 0.0])
     
     # Calculate expected change based on the Elo formula: K * (result - expected)
-    expected_result = elo.expected_outcome(rating, opponent_rating)
-    expected_change = 32 * (result - expected_result)
-    expected_new_rating = rating + expected_change
+    expected_result = elo_expected(rating, opponent_rating)
+    expected_new_ratings = rating + 32 * (results - expected_result)
     
-    # Calculate actual new rating
-    new_rating = elo.calculate_rating(rating, [(opponent_rating, result)])
+    # Calculate actual new ratings
+    new_ratings = np.array([elo.calculate_rating(rating, [(opponent_rating, result)])
+                            for result in results])
     
-    # The new rating should match our expectation
-    assert math.isclose(new_rating, expected_new_rating, abs_tol=1e-6)
+    # The new ratings should match our expectation
+    np.testing.assert_allclose(new_ratings, expected_new_ratings, rtol=0, atol=1e-6)
     
-    # Check the direction of rating change:
-    if result > expected_result:  # Better than expected result
-        assert new_rating > rating
-    elif result < expected_result:  # Worse than expected result
-        assert new_rating < rating
-    else:  # Result matches expectation
-        assert math.isclose(new_rating, rating, abs_tol=1e-6)
+    # Check the direction of rating change: better than expected gains rating,
+    # worse than expected loses rating, and a matching result leaves it unchanged
+    direction = np.sign(np.round(new_ratings - rating, 6))
+    assert np.array_equal(direction, np.sign(results - expected_result))
 
 
-def test_calculate_rating_change():
+def test_calculate_rating_change(elo_expected):
     """
     Test the rating change calculation for a single match.
     """
@@ -102,18 +101,20 @@ def test_calculate_rating_change():
     
     # Win against equal opponent (expected = 0.5)
     change = elo.calculate_rating_change(1500, 1500, 1.0)
-    assert math.isclose(change, 20 * 0.5, abs_tol=1e-6)
+    assert change == pytest.approx(20 * (1.0 - elo_expected(1500, 1500)), abs=1e-6)
     
     # Loss against weaker opponent (expected > 0.5)
     change = elo.calculate_rating_change(1600, 1400, 0.0)
     assert change < 0  # Should lose rating
+    assert change == pytest.approx(20 * (0.0 - elo_expected(1600, 1400)), abs=1e-6)
     
     # Draw against stronger opponent (expected < 0.5)
     change = elo.calculate_rating_change(1400, 1600, 0.5)
     assert change > 0  # Should gain rating
+    assert change == pytest.approx(20 * (0.5 - elo_expected(1400, 1600)), abs=1e-6)
 
 
-def test_calculate_rating_multiple_outcomes():
+def test_calculate_rating_multiple_outcomes(elo_oracle, elo_expected):
     """
     Test calculate_rating when multiple match outcomes are provided.
     """
@@ -121,21 +122,63 @@ def test_calculate_rating_multiple_outcomes():
     rating = 1500
     outcomes = [(1600, 1.0), (1400, 0.0), (1500, 0.5)]
     
-    # Calculate expected new rating
-    expected_new_rating = rating
-    for opp, res in outcomes:
-        exp = elo.expected_outcome(rating, opp)
-        expected_new_rating += 24 * (res - exp)
+    # Reference: all expected scores are taken against the pre-period rating
+    opps = np.array([1600, 1400, 1500])
+    results = np.array([1.0, 0.0, 0.5])
+    expected_new_rating = elo_oracle(rating, opps, results, 24)
+    
+    # The period update is the sum of the per-match changes
+    per_match = rating + 24 * sum(result - elo_expected(rating, opp) for opp, result in outcomes)
+    assert expected_new_rating == pytest.approx(per_match, abs=1e-9)
     
     new_rating = elo.calculate_rating(rating, outcomes)
-    assert math.isclose(new_rating, expected_new_rating, abs_tol=1e-6)
+    assert new_rating == pytest.approx(expected_new_rating, abs=1e-6)
+    
+    batch_rating = elo.calculate_rating_batch(rating, opps, results)
+    assert batch_rating == pytest.approx(expected_new_rating, abs=1e-6)
 
 
-def test_adjust_k_factor():
+def test_calculate_rating_grid(elo_expected):
+    """
+    Test single-match updates across a grid of ratings, opponents and results
+    against the reference expected score computed by broadcasting.
+    """
+    elo = EloRatingSystem(k_factor=32)
+    ratings = np.arange(1000, 2001, 100)
+    opponents = ratings.reshape(-1, 1)
+    results = np.array([1.0, 0.5, 0.0])
+    
+    # expected[i, j] is the expected score of ratings[j] against opponents[i]
+    expected = elo_expected(ratings, opponents)
+    expected_new_ratings = ratings + 32 * (results[:, None, None] - expected[None, :, :])
+    
+    new_ratings = np.array([
+        [[elo.calculate_rating(rating, [(opp, result)]) for rating in ratings] for opp in ratings]
+        for result in results
+    ])
+    np.testing.assert_allclose(new_ratings, expected_new_ratings, rtol=0, atol=1e-6)
+
+
+def test_calculate_rating_batch():
+    """
+    Test the array-based batch update's empty and mismatched-length inputs.
+    """
+    elo = EloRatingSystem(k_factor=24)
+    rating = 1500
+    
+    # No matches leaves the rating unchanged
+    assert elo.calculate_rating_batch(rating, np.array([]), np.array([])) == rating
+    
+    # Opponents and results must pair up one-to-one rather than broadcast
+    with pytest.raises(ValueError):
+        elo.calculate_rating_batch(rating, [1600, 1400, 1500], [1.0])
+
+
+def test_adjust_k_factor(elo_default):
     """
     Test that the adjust_k_factor method returns different K values based on rating.
     """
-    elo = EloRatingSystem()
+    elo = elo_default
     assert elo.adjust_k_factor(1500) == 32
     assert elo.adjust_k_factor(2099) == 32
     assert elo.adjust_k_factor(2100) == 24
@@ -153,11 +196,11 @@ def test_get_rating_with_dynamic_k():
     outcomes = [(2000, 1.0)]
     new_standard = elo.calculate_rating(rating, outcomes)
     new_dynamic = elo.get_rating_with_dynamic_k(rating, outcomes)
-    assert math.isclose(new_standard, new_dynamic, abs_tol=1e-6)
+    assert new_standard == pytest.approx(new_dynamic, abs=1e-6)
 
     rating = 2200
     outcomes = [(2000, 1.0)]
     explicit_elo = EloRatingSystem(k_factor=24)
     new_explicit = explicit_elo.calculate_rating(rating, outcomes)
     new_dynamic = elo.get_rating_with_dynamic_k(rating, outcomes)
-    assert math.isclose(new_explicit, new_dynamic, abs_tol=1e-6)
\ No newline at end of file
+    assert new_explicit == pytest.approx(new_dynamic, abs=1e-6)
\ No newline at end of file
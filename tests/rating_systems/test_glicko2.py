@@ -1,7 +1,12 @@
 import math
+import numpy as np
 import pytest
 from chuk_leaderboard.rating_systems.glicko2 import Glicko2RatingSystem
 
+# Shared starting rating and three-match rating period used across tests
+_START = (1500, 200, 0.06)
+_OUTCOMES_3 = ((1600, 30, 1.0), (1400, 100, 0.0), (1500, 50, 0.5))
+
 
 def test_get_default_rating():
     """
@@ -26,45 +31,40 @@ def test_get_display_name():
     assert g2.get_display_name() == "Glicko-2 (τ=0.3)"
 
 
-def test_no_outcomes():
+@pytest.mark.parametrize("rating,rd,vol", [
+    (1500, 100, 0.06),  # Low RD
+    (1500, 200, 0.06),  # Medium RD
+    (1500, 300, 0.06),  # High RD
+    (1500, 350, 0.06),  # Default RD
+])
+def test_no_outcomes(rating, rd, vol, glicko2_default):
     """
     When no outcomes are provided, the rating and volatility should
     remain unchanged, while the rating deviation (rd) should increase
     according to the formula sqrt(rd^2 + vol^2), capped at the default RD.
     """
-    g = Glicko2RatingSystem()
+    current_rating = (rating, rd, vol)
+    new_rating, new_rd, new_vol = glicko2_default.calculate_rating(current_rating, [])
     
-    # Test with different starting RD values
-    test_cases = [
-        (1500, 100, 0.06),  # Low RD
-        (1500, 200, 0.06),  # Medium RD
-        (1500, 300, 0.06),  # High RD
-        (1500, 350, 0.06),  # Default RD
-    ]
+    # The rating should be unchanged
+    assert new_rating == rating
+    # Volatility should be unchanged
+    assert new_vol == vol
     
-    for rating, rd, vol in test_cases:
-        current_rating = (rating, rd, vol)
-        new_rating, new_rd, new_vol = g.calculate_rating(current_rating, [])
-        
-        # The rating should be unchanged
-        assert new_rating == rating
-        # Volatility should be unchanged
-        assert new_vol == vol
-        
-        # Calculate expected new RD from inactivity
-        expected_new_rd = min(math.sqrt(rd**2 + vol**2), 350)
-        assert math.isclose(new_rd, expected_new_rd, rel_tol=1e-6)
-
-
-def test_expected_outcome():
+    # Calculate expected new RD from inactivity
+    expected_new_rd = min(math.sqrt(rd**2 + vol**2), 350)
+    assert new_rd == pytest.approx(expected_new_rd, rel=1e-6)
+
+
+def test_expected_outcome(glicko2_default):
     """
     Test the expected outcome computation between players with distinct ratings.
     """
-    g = Glicko2RatingSystem()
+    g = glicko2_default
     
     # Test: equal ratings and RDs should result in 0.5 win probability
     equal_probability = g.expected_outcome((1500, 100), (1500, 100))
-    assert math.isclose(equal_probability, 0.5, abs_tol=1e-6)
+    assert equal_probability == pytest.approx(0.5, abs=1e-6)
     
     # Test: higher rating should have higher win probability
     higher_probability = g.expected_outcome((1600, 100), (1400, 100))
@@ -77,47 +77,53 @@ def test_expected_outcome():
     # Test: symmetry property
     p_a = g.expected_outcome((1700, 100), (1500, 100))
     p_b = g.expected_outcome((1500, 100), (1700, 100))
-    assert math.isclose(p_a + p_b, 1.0, abs_tol=1e-6)
+    assert p_a + p_b == pytest.approx(1.0, abs=1e-6)
     
     # High RD impact check
     high_rd_prob = g.expected_outcome((1700, 300), (1500, 50))
     assert 0.5 < high_rd_prob < 1.0
 
-@pytest.mark.parametrize("result", [1.0, 0.5, 0.0])
-def test_calculate_rating_single_outcome(result):
+def test_calculate_rating_single_outcome():
     """
     Test calculate_rating for a single match. Rating should move,
     RD decrease, and vol within bounds.
     """
     g = Glicko2RatingSystem()
-    start = (1500, 200, 0.06)
-    new_rating, new_rd, new_vol = g.calculate_rating(start, [(1600, 30, result)])
+    start = _START
+    results = np.array([1.0, 0.5, 0.0])
+    new = np.array([g.calculate_rating(start, [(1600, 30, result)]) for result in results])
+    new_rating, new_rd, new_vol = new.T
 
     # Direction check
-    if result > 0.5:
-        assert new_rating > start[0]
-    elif result < 0.5:
-        assert new_rating < start[0]
+    assert np.all(new_rating[results > 0.5] > start[0])
+    assert np.all(new_rating[results < 0.5] < start[0])
     # RD decreases
-    assert new_rd < start[1]
+    assert np.all(new_rd < start[1])
     # Vol stays in [0.01,0.1]
-    assert 0.01 <= new_vol <= 0.1
+    assert np.all((0.01 <= new_vol) & (new_vol <= 0.1))
 
 
-def test_calculate_rating_multiple_outcomes():
+def test_calculate_rating_multiple_outcomes(glicko2_oracle):
     """
     Test calculate_rating over multiple matches. RD drops significantly,
     vol remains bounded.
     """
     g = Glicko2RatingSystem()
-    start = (1500, 200, 0.06)
-    outcomes = [(1600, 30, 1.0), (1400, 100, 0.0), (1500, 50, 0.5)]
+    start = _START
+    outcomes = _OUTCOMES_3
     new_rating, new_rd, new_vol = g.calculate_rating(start, outcomes)
 
     assert new_rd < 200 * 0.8
     assert 0.01 <= new_vol <= 0.1
 
+    # Rating and RD follow the Glicko-2 equations for the chosen volatility
+    opp_ratings, opp_rds, results = np.array(outcomes).T
+    expected_rating, expected_rd = glicko2_oracle(*start[:2], new_vol, opp_ratings, opp_rds, results)
+    assert new_rating == pytest.approx(expected_rating, abs=1e-6)
+    assert new_rd == pytest.approx(expected_rd, abs=1e-6)
 
+
+@pytest.mark.slow
 def test_rating_consistency():
     """
     Players who always win should grow; always lose should fall; RD shrinks.
@@ -144,43 +150,51 @@ def test_extreme_rating_differences():
     g = Glicko2RatingSystem()
     high=(2200,50,0.06)
     low=(800,50,0.06)
-    p = g.expected_outcome(high[:2], low[:2])
-    assert p>0.99
+    high2, low2 = high[:2], low[:2]
+    p_high = g.expected_outcome(high2, low2)
+    assert p_high > 0.99
+    # Equal RDs make the matchup symmetric, so the underdog's chance is 1 - p_high
+    assert g.expected_outcome(low2, high2) == pytest.approx(1.0 - p_high, abs=1e-12)
     new_high,_,_ = g.calculate_rating(high, [(low[0],low[1],0.0)])
     new_low,_,_ = g.calculate_rating(low, [(high[0],high[1],1.0)])
     assert new_high<high[0]-10
     assert new_low>low[0]+10
 
 
-def test_tau_parameter():
+def test_tau_parameter(glicko2_tau):
     """
     Different tau values run without error and produce bounded outputs.
     """
-    g1=Glicko2RatingSystem(tau=0.3)
-    g2=Glicko2RatingSystem(tau=1.2)
-    start=(1500,200,0.06)
-    out1=g1.calculate_rating(start,[(1000,30,0.0)])
-    out2=g2.calculate_rating(start,[(1000,30,0.0)])
-    for val in (out1+out2):
+    out=glicko2_tau.calculate_rating(_START,[(1000,30,0.0)])
+    for val in out:
         assert isinstance(val,float)
 
 
 def test_rd_effects_on_rating_change():
     """
     Higher RD => larger shifts when winning.
+    With the same rating and opponent, g and E are identical, so the rating
+    change scales with the post-period variance: the ratio of the changes
+    is (new_rd_uncertain / new_rd_certain)^2.
     """
     g=Glicko2RatingSystem()
     certain=(1500,30,0.06)
     uncertain=(1500,300,0.06)
     opp=(1500,100,0.5)
-    new_c,_,_ = g.calculate_rating(certain, [(opp[0],opp[1],1.0)])
-    new_u,_,_ = g.calculate_rating(uncertain,[(opp[0],opp[1],1.0)])
+    new_c,new_rd_c,_ = g.calculate_rating(certain, [(opp[0],opp[1],1.0)])
+    new_u,new_rd_u,_ = g.calculate_rating(uncertain,[(opp[0],opp[1],1.0)])
     assert abs(new_u-uncertain[0])>abs(new_c-certain[0])
+    
+    actual_ratio = (new_u-uncertain[0]) / (new_c-certain[0])
+    predicted_ratio = (new_rd_u / new_rd_c)**2
+    assert actual_ratio == pytest.approx(predicted_ratio, rel=1e-6)
 
 
+@pytest.mark.slow
 def test_inactivity_periods():
     """
     Multiple inactivity periods inflate RD without changing rating or vol.
+    Each period adds vol^2 to RD^2, so after n periods RD = sqrt(rd^2 + n*vol^2).
     """
     g=Glicko2RatingSystem()
     start=(1500,50,0.06)
@@ -188,5 +202,6 @@ def test_inactivity_periods():
     for _ in range(5):
         cur=g.calculate_rating(cur,[])
     assert cur[0]==1500
+    assert cur[1] == pytest.approx(math.sqrt(50**2 + 5*0.06**2), rel=1e-6)
     assert 50<cur[1]<=350
     assert cur[2]==0.06
@@ -1,7 +1,9 @@
-import math
+import numpy as np
 import pytest
 from typing import List, Tuple
-from chuk_leaderboard.rating_systems.points_based import PointsBasedRankingSystem
+from chuk_leaderboard.rating_systems.points_based import (
+    PointsBasedRankingSystem, PlayerTable, PointsRating, HistoryBuffer, Projection
+)
 
 
 def test_get_default_rating():
@@ -21,6 +23,24 @@ def test_get_default_rating():
     assert custom_default[1] == []
 
 
+def test_points_rating_fields():
+    """
+    Test that ratings expose named fields while still behaving as (total, history) tuples.
+    """
+    points_system = PointsBasedRankingSystem()
+    
+    rating = points_system.calculate_rating((100.0, [20.0]), [30.0])
+    assert isinstance(rating, PointsRating)
+    assert rating.total == 130.0
+    assert rating.history == [20.0, 30.0]
+    assert rating == (130.0, [20.0, 30.0])
+    
+    # Ratings can be fed straight back into the system
+    total, history = points_system.calculate_rating(rating, [10.0])
+    assert total == 140.0
+    assert history == [20.0, 30.0, 10.0]
+
+
 def test_get_display_name():
     """
     Test that the display name is correctly generated.
@@ -34,61 +54,42 @@ def test_get_display_name():
     assert rank_system.get_display_name() == "Points-Based (Ranked)"
 
 
-def test_no_outcomes():
+def test_no_outcomes(points_default):
     """
     When no outcomes are provided, the points and history should remain unchanged.
     """
-    points_system = PointsBasedRankingSystem()
-    
     # Test with just points (no history)
     total_points = 100.0
-    new_total, new_history = points_system.calculate_rating(total_points, [])
+    new_total, new_history = points_default.calculate_rating(total_points, [])
     assert new_total == total_points
     assert new_history == []
     
     # Test with points and history
     current_rating = (100.0, [20.0, 30.0, 50.0])
-    new_total, new_history = points_system.calculate_rating(current_rating, [])
+    new_total, new_history = points_default.calculate_rating(current_rating, [])
     assert new_total == current_rating[0]
     assert new_history == current_rating[1]
-
-
-def test_calculate_rating_single_outcome():
-    """
-    Test calculate_rating with a single outcome.
-    """
-    points_system = PointsBasedRankingSystem()
-    
-    # Test with just points (no history)
-    total_points = 100.0
-    outcomes = [25.0]  # Add 25 points
-    
-    new_total, new_history = points_system.calculate_rating(total_points, outcomes)
-    assert new_total == total_points + 25.0
-    assert new_history == [25.0]
     
-    # Test with points and history
-    current_rating = (100.0, [20.0, 30.0, 50.0])
-    outcomes = [35.0]  # Add 35 points
-    
-    new_total, new_history = points_system.calculate_rating(current_rating, outcomes)
-    assert new_total == current_rating[0] + 35.0
-    assert new_history == current_rating[1] + [35.0]
+    # A PointsRating is returned unchanged, without copying
+    rating = points_default.get_default_rating()
+    assert points_default.calculate_rating(rating, []) is rating
 
 
-def test_calculate_rating_multiple_outcomes():
+@pytest.mark.parametrize("current_rating, outcomes, expected_total, expected_history", [
+    # Single outcome, just points (no history)
+    (100.0, [25.0], 125.0, [25.0]),
+    # Single outcome, points and history
+    ((100.0, [20.0, 30.0, 50.0]), [35.0], 135.0, [20.0, 30.0, 50.0, 35.0]),
+    # Multiple outcomes
+    ((100.0, [20.0, 30.0]), [15.0, 25.0, 35.0], 175.0, [20.0, 30.0, 15.0, 25.0, 35.0]),
+])
+def test_calculate_rating(points_default, current_rating, outcomes, expected_total, expected_history):
     """
-    Test calculate_rating with multiple outcomes.
+    Test calculate_rating adds outcome points to the total and appends them to the history.
     """
-    points_system = PointsBasedRankingSystem()
-    
-    # Test with multiple outcomes
-    current_rating = (100.0, [20.0, 30.0])
-    outcomes = [15.0, 25.0, 35.0]  # Multiple events
-    
-    new_total, new_history = points_system.calculate_rating(current_rating, outcomes)
-    assert new_total == current_rating[0] + sum(outcomes)
-    assert new_history == current_rating[1] + outcomes
+    new_total, new_history = points_default.calculate_rating(current_rating, outcomes)
+    assert new_total == expected_total
+    assert new_history == expected_history
 
 
 def test_rank_points():
@@ -110,22 +111,147 @@ def test_rank_points():
     assert new_history == outcomes
 
 
-def test_bonus_points():
+@pytest.mark.parametrize("bonus_threshold, bonus_points, outcomes, expected_total", [
+    # Two scores above threshold: 80 + (120+10) + 90 + (150+10) = 460
+    (100.0, 10.0, [80.0, 120.0, 90.0, 150.0], 460.0),
+    # No scores above threshold
+    (100.0, 10.0, [80.0, 90.0], 170.0),
+    # Scores equal to the threshold earn no bonus: 50 + (51+5) = 106
+    (50.0, 5.0, [50.0, 51.0], 106.0),
+])
+def test_bonus_points(bonus_threshold, bonus_points, outcomes, expected_total):
     """
     Test that bonus points are correctly applied.
     """
-    # Define a system with bonus points for scores over 100
-    bonus_system = PointsBasedRankingSystem(bonus_threshold=100.0, bonus_points=10.0)
+    bonus_system = PointsBasedRankingSystem(bonus_threshold=bonus_threshold, bonus_points=bonus_points)
     
-    # Test with various scores
-    current_rating = (0.0, [])
-    outcomes = [80.0, 120.0, 90.0, 150.0]  # Two scores above threshold
+    new_total, new_history = bonus_system.calculate_rating((0.0, []), outcomes)
+    assert new_total == expected_total
+    assert new_history == outcomes  # History stores original scores
+
+
+@pytest.mark.parametrize("config", [
+    {},
+    {"bonus_threshold": 3.0, "bonus_points": 1.0},
+    {"rank_points": [10, 8, 6, 4, 2]},
+    {"rank_points": [10, 8, 6, 4, 2], "bonus_threshold": 7.0, "bonus_points": 1.0},
+], ids=["plain", "bonus", "rank", "rank+bonus"])
+def test_large_batch_scoring(config):
+    """
+    Test that large outcome batches score the same as the same outcomes in small batches,
+    including ranks outside the rank points list (below 1 and beyond the last rank).
+    """
+    points_system = PointsBasedRankingSystem(**config)
+    outcomes = [-1, 0, 0.5, 1, 2, 3, 4, 5, 6, 7] * 10
     
-    new_total, new_history = bonus_system.calculate_rating(current_rating, outcomes)
+    new_total, new_history = points_system.calculate_rating((0.0, []), outcomes)
     
-    # Expected points: 80 + (120+10) + 90 + (150+10) = 460
-    assert new_total == 460.0
-    assert new_history == outcomes  # History stores original scores
+    # Score the same outcomes in chunks small enough for the Python loop
+    expected_total = 0.0
+    for start in range(0, len(outcomes), 10):
+        expected_total += points_system.calculate_rating(0.0, outcomes[start:start + 10])[0]
+    
+    assert new_total == pytest.approx(expected_total)
+    assert new_history == outcomes
+    
+    if config.get("rank_points") and config.get("bonus_threshold"):
+        # Per cycle: 0 + 0 + 0 + 11 + 9 + 6 + 4 + 2 + 0 + 0 = 32 points
+        assert new_total == 32.0 * 10
+
+
+def test_batch_calculate():
+    """
+    Test that batch updates match individual calculate_rating calls, in order.
+    """
+    points_system = PointsBasedRankingSystem(bonus_threshold=30.0, bonus_points=5.0)
+    
+    ratings = [100.0, (50.0, [20.0]), (0.0, [])]
+    outcomes_list = [[25.0], [], [10.0, 40.0] * 40]
+    
+    results = points_system.batch_calculate(ratings, outcomes_list)
+    assert results == [points_system.calculate_rating(rating, outcomes)
+                       for rating, outcomes in zip(ratings, outcomes_list)]
+    
+    # Every participant needs an outcomes entry; nothing is silently dropped
+    with pytest.raises(ValueError):
+        points_system.batch_calculate(ratings, outcomes_list[:2])
+
+
+def test_scoring_config_is_read_only():
+    """
+    Test that scoring rules cannot change after construction, so small and large batches agree.
+    """
+    points_system = PointsBasedRankingSystem(rank_points=[10, 8, 6], bonus_threshold=7.0, bonus_points=1.0)
+    
+    for name, value in (("rank_points", [1, 1, 1]), ("bonus_threshold", None), ("bonus_points", 100.0)):
+        with pytest.raises(AttributeError):
+            setattr(points_system, name, value)
+    
+    # Mutating the list passed in does not change scoring either
+    rank_points = [10.0, 8.0, 6.0]
+    ranked = PointsBasedRankingSystem(rank_points=rank_points)
+    rank_points[0] = 100.0
+    assert ranked.rank_points == [10.0, 8.0, 6.0]
+    
+    outcomes = [1, 2, 3, 4]
+    small_total, _ = ranked.calculate_rating((0.0, []), outcomes * 15)
+    large_total, _ = ranked.calculate_rating((0.0, []), outcomes * 16)
+    assert small_total == 24.0 * 15
+    assert large_total == 24.0 * 16
+
+
+def test_calculate_rating_inplace():
+    """
+    Test that the in-place variant extends the existing history list.
+    """
+    points_system = PointsBasedRankingSystem(bonus_threshold=30.0, bonus_points=5.0)
+    
+    history = [20.0, 30.0]
+    current_rating = (50.0, history)
+    outcomes = [15.0, 35.0]
+    
+    expected = points_system.calculate_rating(current_rating, outcomes)
+    new_total, new_history = points_system.calculate_rating_inplace(current_rating, outcomes)
+    
+    assert (new_total, new_history) == expected
+    assert new_history is history
+    assert history == [20.0, 30.0, 15.0, 35.0]
+
+
+def test_history_buffer():
+    """
+    Test that the history buffer grows past its capacity and reads like a list.
+    """
+    points_system = PointsBasedRankingSystem()
+    rating = (0.0, HistoryBuffer())
+    
+    # Grow well beyond the initial capacity one event at a time
+    expected = []
+    for week in range(50):
+        rating = points_system.calculate_rating_inplace(rating, [float(week)])
+        expected.append(float(week))
+    
+    history = rating.history
+    assert len(history) == 50
+    assert history == expected
+    assert history[-3:] == [47.0, 48.0, 49.0]
+    assert history[10] == 10.0
+    assert list(history) == expected
+    assert history != expected[:-1]
+    assert history != "not a history"
+    assert rating.total == 1225.0  # 0 + 1 + ... + 49
+    
+    # The copying update keeps the buffer type and leaves the original untouched
+    new_total, new_history = points_system.calculate_rating(rating, [100.0])
+    assert isinstance(new_history, HistoryBuffer)
+    assert new_history == expected + [100.0]
+    assert history == expected
+    
+    # List-style concatenation and extending from a generator
+    assert history + [50.0] == expected + [50.0]
+    assert [-1.0] + history == [-1.0] + expected
+    history.extend(float(week) for week in range(50, 53))
+    assert history[-3:] == [50.0, 51.0, 52.0]
 
 
 def test_expected_outcome_with_total_points():
@@ -134,22 +260,15 @@ def test_expected_outcome_with_total_points():
     """
     points_system = PointsBasedRankingSystem(points_history_weight=0.0)
     
-    # Test with equal points
-    prob = points_system.expected_outcome(1000.0, 1000.0)
-    assert math.isclose(prob, 0.5, abs_tol=1e-6)
-    
-    # Test with higher player1 points
-    prob = points_system.expected_outcome(1200.0, 1000.0)
-    assert prob > 0.5
-    
-    # Test with lower player1 points
-    prob = points_system.expected_outcome(800.0, 1000.0)
-    assert prob < 0.5
+    # Test with higher and lower player1 points
+    assert points_system.expected_outcome(1200.0, 1000.0) > 0.5
+    assert points_system.expected_outcome(800.0, 1000.0) < 0.5
     
-    # Test symmetry
+    # Test equal points and symmetry in one tolerance check
     prob1 = points_system.expected_outcome(1200.0, 1000.0)
     prob2 = points_system.expected_outcome(1000.0, 1200.0)
-    assert math.isclose(prob1 + prob2, 1.0, abs_tol=1e-6)
+    got = np.array([points_system.expected_outcome(1000.0, 1000.0), prob1 + prob2])
+    np.testing.assert_allclose(got, [0.5, 1.0], rtol=0, atol=1e-6)
 
 
 def test_expected_outcome_with_history_weight():
@@ -173,74 +292,125 @@ def test_expected_outcome_with_history_weight():
     assert prob < 0.5
 
 
-def test_project_season_finish():
+def test_expected_outcome_matrix():
+    """
+    Test that the pairwise probability matrix matches expected_outcome for every pair.
+    """
+    participants = [
+        (1200.0, [20.0, 30.0, 40.0]),
+        (1000.0, [80.0, 90.0, 100.0]),
+        (1100.0, []),
+        950.0
+    ]
+    
+    for weight in (0.0, 0.5):
+        points_system = PointsBasedRankingSystem(points_history_weight=weight)
+        matrix = points_system.expected_outcome_matrix(participants)
+        
+        assert matrix.shape == (4, 4)
+        for i, rating1 in enumerate(participants):
+            for j, rating2 in enumerate(participants):
+                assert matrix[i, j] == pytest.approx(points_system.expected_outcome(rating1, rating2))
+
+
+def test_project_season_finish(points_default):
     """
     Test season projection calculations.
     """
-    points_system = PointsBasedRankingSystem()
-    
     # Test with consistent performance
     current_rating = (300.0, [20.0, 20.0, 20.0, 20.0])
     remaining_events = 6
     
-    projection = points_system.project_season_finish(current_rating, remaining_events)
-    
-    # Expected: 300 + (20 * 6) = 420
-    assert math.isclose(projection["projected_points"], 420.0, abs_tol=1e-6)
+    projection = points_default.project_season_finish(current_rating, remaining_events)
     
-    # Min and max should be same (all performances identical)
-    assert math.isclose(projection["min_points"], 300.0 + 20.0 * remaining_events, abs_tol=1e-6)
-    assert math.isclose(projection["max_points"], 300.0 + 20.0 * remaining_events, abs_tol=1e-6)
+    # Expected: 300 + (20 * 6) = 420; min and max are the same (all performances identical)
+    got = np.array([projection["projected_points"], projection["min_points"], projection["max_points"]])
+    np.testing.assert_allclose(got, [420.0, 420.0, 420.0], rtol=0, atol=1e-6)
     
     # Test with varied performance
     current_rating = (300.0, [10.0, 20.0, 30.0, 40.0])
     remaining_events = 6
     
-    projection = points_system.project_season_finish(current_rating, remaining_events)
+    projection = points_default.project_season_finish(current_rating, remaining_events)
     
     # Expected: 300 + (avg of 10,20,30,40) * 6 = 300 + 25 * 6 = 450
-    assert math.isclose(projection["projected_points"], 450.0, abs_tol=1e-6)
-    
-    # Min points: 300 + (10 * 6) = 360
-    assert math.isclose(projection["min_points"], 360.0, abs_tol=1e-6)
-    
-    # Max points: 300 + (40 * 6) = 540
-    assert math.isclose(projection["max_points"], 540.0, abs_tol=1e-6)
+    # Min points: 300 + (10 * 6) = 360; max points: 300 + (40 * 6) = 540
+    got = np.array([projection["projected_points"], projection["min_points"], projection["max_points"]])
+    np.testing.assert_allclose(got, [450.0, 360.0, 540.0], rtol=0, atol=1e-6)
 
 
-def test_get_trend():
+def test_projection_access(points_default):
+    """
+    Test that projections can be read by attribute, by key and as a dictionary.
+    """
+    projection = points_default.project_season_finish((300.0, [10.0, 20.0, 30.0, 40.0]), 6)
+    
+    assert isinstance(projection, Projection)
+    assert projection.projected_points == projection["projected_points"] == projection[0]
+    assert projection.to_dict()["max_points"] == projection["max_points"]
+    with pytest.raises(KeyError):
+        projection["average"]
+    
+    # Dictionary-style reads
+    assert "projected_points" in projection
+    assert "average" not in projection
+    assert projection.get("lower_bound") == projection.lower_bound
+    assert projection.get("average", 0.0) == 0.0
+    assert list(projection.keys()) == list(projection.to_dict().keys())
+    assert dict(projection.items()) == projection.to_dict()
+    assert list(projection.values()) == list(projection.to_dict().values())
+
+
+def test_project_season_finish_many(points_default):
+    """
+    Test that batch projections match individual project_season_finish calls.
+    """
+    ratings = [
+        (300.0, [10.0, 20.0, 30.0, 40.0]),
+        (250.0, []),
+        (120.0, [40.0]),
+        (310.0, [20.0, 20.0, 20.0, 20.0])
+    ]
+    
+    for confidence_level in (0.90, 0.95, 0.99):
+        projections = points_default.project_season_finish_many(ratings, 6, confidence_level)
+        
+        assert projections.dtype.names == Projection._fields
+        expected = np.array([points_default.project_season_finish(rating, 6, confidence_level)
+                             for rating in ratings])
+        got = np.array([projections[field] for field in Projection._fields]).T
+        np.testing.assert_allclose(got, expected, rtol=0, atol=1e-6)
+
+
+def test_get_trend(points_default):
     """
     Test trend calculation.
     """
-    points_system = PointsBasedRankingSystem()
-    
     # Test improving trend
     history = [10.0, 20.0, 30.0, 40.0, 50.0, 60.0]
-    trend = points_system.get_trend(history)
+    trend = points_default.get_trend(history)
     assert trend == "up"
     
     # Test declining trend
     history = [60.0, 50.0, 40.0, 30.0, 20.0, 10.0]
-    trend = points_system.get_trend(history)
+    trend = points_default.get_trend(history)
     assert trend == "down"
     
     # Test stable trend
     history = [25.0, 24.0, 26.0, 25.0, 24.0, 26.0]
-    trend = points_system.get_trend(history)
+    trend = points_default.get_trend(history)
     assert trend == "stable"
     
     # Test not enough data
     history = [25.0, 30.0, 35.0]
-    trend = points_system.get_trend(history)
+    trend = points_default.get_trend(history)
     assert trend == "stable"  # Default with insufficient data
 
 
-def test_rank_participants():
+def test_rank_participants(points_default):
     """
     Test participant ranking functionality.
     """
-    points_system = PointsBasedRankingSystem()
-    
     # Create a set of participants with different point totals
     participants = {
         "Player A": (120.0, [30.0, 40.0, 50.0]),
@@ -250,7 +420,7 @@ def test_rank_participants():
     }
     
     # Get the rankings
-    rankings = points_system.rank_participants(participants)
+    rankings = points_default.rank_participants(participants)
     
     # Check the ranking order
     assert rankings[0][0] == "Player D"  # 1st place
@@ -262,4 +432,37 @@ def test_rank_participants():
     assert rankings[0][1] == 180.0
     assert rankings[1][1] == 150.0
     assert rankings[2][1] == 120.0
-    assert rankings[3][1] == 100.0
\ No newline at end of file
+    assert rankings[3][1] == 100.0
+
+
+def test_player_table_rank():
+    """
+    Test ranking participants added one at a time, with ties kept in insertion order.
+    """
+    table = PlayerTable()
+    table.add("Player A", (120.0, [30.0, 40.0, 50.0]))
+    table.add("Player B", (150.0, [40.0, 50.0, 60.0]))
+    table.add("Player C", (120.0, [20.0, 50.0, 50.0]))
+    
+    assert table.rank() == [("Player B", 150.0), ("Player A", 120.0), ("Player C", 120.0)]
+    
+    # Adding many participants keeps every total
+    for i in range(20):
+        table.add(f"Player {i}", (float(i), []))
+    assert len(table.names) == len(table.totals) == 23
+    assert table.rank()[:2] == [("Player B", 150.0), ("Player A", 120.0)]
+    assert table.rank()[-1] == ("Player 0", 0.0)
+
+
+def test_top_k():
+    """
+    Test that top_k matches the head of the full ranking, including ties at the cut-off.
+    """
+    points_system = PointsBasedRankingSystem()
+    
+    totals = [120.0, 150.0, 120.0, 90.0, 150.0, 120.0, 180.0]
+    participants = {f"Player {i}": (total, []) for i, total in enumerate(totals)}
+    rankings = points_system.rank_participants(participants)
+    
+    for k in range(len(totals) + 2):
+        assert points_system.top_k(participants, k) == rankings[:k]